@@ -1,7 +1,9 @@
-from computed import computed_property
+from computed import computed_property, computed_slots
 
 
 class Circle:
+    __slots__ = ('radius',) + computed_slots('diameter', 'area')
+
     def __init__(self, radius=1):
         self.radius = radius
 
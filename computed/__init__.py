@@ -1,5 +1,5 @@
 """ Docstring for the __init__.py module.
 
 """
-from .computed_property import ComputedProperty
+from .computed_property import ComputedProperty, computed_slots
 from .computed_property_decorator import computed_property
@@ -6,11 +6,70 @@ properties with the following features:
 - Dependency tracking (invalidates cache when dependencies change)
 - Support for getters, setters, and deleters
 - Proper documentation inheritance
+- Support for `__slots__` classes, whose cache slots are reserved with `computed_slots()`
 
 The descriptor is designed to be used as a decorator similar to Python's built-in
 @property, but with additional functionality for managing dependencies between
 properties.
 """
+import sys
+import weakref
+from types import MappingProxyType
+
+# Writable dependency maps keyed by the class that owns them. Classes only expose a
+# read-only view as `__computed_dependency_map__`, so user code cannot corrupt them.
+_dependency_maps = weakref.WeakKeyDictionary()
+
+# Marks an invalidated cache slot. Slots are reset to it instead of being deleted, so
+# invalidating never raises (and catches) AttributeError for an already empty slot
+_NOT_CACHED = object()
+
+
+def _writable_dependency_map(owner):
+    """
+    Return the writable dependency map used by a class, creating it if needed.
+
+    Like the read-only view, the map is shared with the closest base class that
+    already has one when both cache in the instance `__dict__`, where invalidating a
+    cache the instance never had is harmless. Otherwise the class registers cache
+    slots that instances of the base lack, so it gets its own map, seeded from the
+    base one.
+
+    Args:
+        owner (type): The class the computed property is defined on.
+
+    Returns:
+        dict: Mapping of attribute names to the tuple of cache names they invalidate.
+    """
+    base_map = {}
+    for cls in owner.__mro__:
+        dependency_map = _dependency_maps.get(cls)
+        if dependency_map is not None:
+            if cls is owner or (cls.__dictoffset__ and owner.__dictoffset__):
+                return dependency_map
+            base_map = dependency_map
+            break
+    dependency_map = _dependency_maps[owner] = dict(base_map)
+    owner.__computed_dependency_map__ = MappingProxyType(dependency_map)
+    return dependency_map
+
+
+def computed_slots(*names):
+    """
+    Return the `__slots__` entries that cache the given computed properties.
+
+    Classes using `__slots__` have no instance `__dict__` to hold cached values, so a slot
+    must be reserved for each computed property:
+
+        __slots__ = ('radius',) + computed_slots('diameter', 'area')
+
+    Args:
+        *names (str): The names of the computed properties defined on the class.
+
+    Returns:
+        tuple: The slot names, to be added to the class's `__slots__`.
+    """
+    return tuple(f"__cached_{name}" for name in names)
 
 
 class ComputedProperty:
@@ -47,37 +106,77 @@ class ComputedProperty:
         Set the name of the computed property and register its dependencies.
 
         This method is called when the computed property is assigned to a class.
-        It also sets up a cache for the computed property and ensures that the
-        `__setattr__` method is overridden to clear cached values when dependencies change.
+        It also sets up a cache for the computed property and, when the property has
+        dependencies, ensures that the `__setattr__` method is overridden to clear cached
+        values when they change.
 
         Args:
             owner (type): The owner class where the computed property is defined.
             name (str): The name of the computed property.
         """
         self.__name__ = name
-        self._cache_name = f"__cached_{name}"
-
-        # Register computed property dependencies
-        if not hasattr(owner, "__computed_dependency_map__"):
-            owner.__computed_dependency_map__ = {}
-
+        self._cache_name = sys.intern(f"__cached_{name}")
+
+        # The instance layout is decided once here rather than probed on every access:
+        # instances without a __dict__ (__slots__) cache in the slot reserved with
+        # computed_slots(), which is name-mangled like any private attribute
+        self._slotted = not owner.__dictoffset__
+        self._cacheable = True
+        slot_name = f"_{owner.__name__.lstrip('_')}{self._cache_name}"
+        if slot_name in owner.__dict__:
+            self._cache_name = sys.intern(slot_name)
+        elif self._slotted:
+            # No storage for the cache: accessing the property raises (even on instances
+            # of subclasses with a __dict__), so there is nothing to invalidate
+            self._cacheable = False
+            return
+
+        # Without dependencies there is nothing to invalidate: skip both the dependency
+        # map registration and the __setattr__ override
+        if not self.dependencies:
+            return
+
+        # Register computed property dependencies, mapping each one straight to the
+        # (immutable) tuple of cache entries it invalidates
+        dependency_map = _writable_dependency_map(owner)
         for dep in self.dependencies:
-            owner.__computed_dependency_map__.setdefault(dep, []).append(name)
+            dependency_map[dep] = dependency_map.get(dep, ()) + (self._cache_name,)
 
-        # Override __setattr__ to handle changes to dependent attributes
-        if not hasattr(owner, "__wrap_computed_setattr__"):
+        # Override __setattr__ (once per dependency map, on the class owning it) to
+        # handle changes to dependent attributes
+        if owner in _dependency_maps and "__has_computed_deps__" not in owner.__dict__:
             original_setattr = owner.__setattr__
-
-            def custom_setattr(obj, key, value):
-                original_setattr(obj, key, value)
-                affected = obj.__class__.__computed_dependency_map__.get(key, [])
-                for attr in affected:
-                    cache_name = f"__cached_{attr}"
-                    if hasattr(obj, cache_name):
-                        delattr(obj, cache_name)
-
+            if self._slotted:
+                # The map was seeded from the base one, so the inherited wrapper would
+                # only reset the same slots again: wrap what it wraps instead
+                original_setattr = getattr(original_setattr, "__computed_original__", original_setattr)
+            # Bind the lookup once: the map is only ever mutated in place, so every write
+            # costs a single dict probe instead of resolving the map through the class
+            affected_caches = dependency_map.get
+
+            if self._slotted:
+                # Reset the slots directly, skipping the wrapped __setattr__ and never
+                # probing obj.__dict__, which __slots__ instances do not have
+                reset_cache = object.__setattr__
+
+                def custom_setattr(obj, key, value):
+                    original_setattr(obj, key, value)
+                    affected = affected_caches(key)
+                    if affected:
+                        for cache_name in affected:
+                            reset_cache(obj, cache_name, _NOT_CACHED)
+            else:
+                def custom_setattr(obj, key, value):
+                    original_setattr(obj, key, value)
+                    affected = affected_caches(key)
+                    if affected:
+                        obj_dict = obj.__dict__
+                        for cache_name in affected:
+                            obj_dict.pop(cache_name, None)
+
+            custom_setattr.__computed_original__ = original_setattr
             owner.__setattr__ = custom_setattr
-            owner.__wrap_computed_setattr__ = True
+            owner.__has_computed_deps__ = True
 
     def __get__(self, obj, objtype=None):
         """
@@ -94,17 +193,53 @@ class ComputedProperty:
             The computed value of the property.
 
         Raises:
-            AttributeError: If there is no getter function for this property.
+            AttributeError: If there is no getter function for this property, or no slot
+                reserved for its cache on a `__slots__` class.
         """
         if obj is None:
             return self
+        cache_name = self._cache_name
+        if self._slotted:
+            # Hit path for __slots__ instances: a single slot read
+            result = getattr(obj, cache_name, _NOT_CACHED)
+            if result is not _NOT_CACHED:
+                return result
+            if not self._cacheable:
+                raise AttributeError(
+                    f"{type(obj).__name__} has no slot to cache {self.__name__}; "
+                    f"add computed_slots({self.__name__!r}) to its __slots__"
+                )
+            result = self._compute(obj)
+            object.__setattr__(obj, cache_name, result)
+            return result
+
+        try:
+            # Hit path: a single dict lookup, nothing else is looked up on the descriptor
+            return obj.__dict__[cache_name]
+        except KeyError:
+            pass
+
+        result = self._compute(obj)
+        # Store straight into the instance dict, bypassing the wrapped __setattr__
+        obj.__dict__[cache_name] = result
+        return result
+
+    def _compute(self, obj):
+        """
+        Evaluate the getter function for a cache miss.
+
+        Args:
+            obj (object): The object that owns the computed property.
+
+        Returns:
+            The freshly computed value of the property.
+
+        Raises:
+            AttributeError: If there is no getter function for this property.
+        """
         if self.func_get is None:
             raise AttributeError(f"No getter for {self.__name__}")
-        if hasattr(obj, self._cache_name):
-            return getattr(obj, self._cache_name)
-        result = self.func_get(obj)
-        setattr(obj, self._cache_name, result)
-        return result
+        return self.func_get(obj)
 
     def __set__(self, obj, value):
         """
@@ -122,8 +257,7 @@ class ComputedProperty:
         if self.func_set is None:
             raise AttributeError(f"No setter for {self.__name__}")
         self.func_set(obj, value)
-        if hasattr(obj, self._cache_name):
-            delattr(obj, self._cache_name)
+        self._clear_cache(obj)
 
     def __delete__(self, obj):
         """
@@ -140,8 +274,20 @@ class ComputedProperty:
         if self.func_del is None:
             raise AttributeError(f"No deleter for {self.__name__}")
         self.func_del(obj)
-        if hasattr(obj, self._cache_name):
-            delattr(obj, self._cache_name)
+        self._clear_cache(obj)
+
+    def _clear_cache(self, obj):
+        """
+        Drop the cached value of the computed property, if any.
+
+        Args:
+            obj (object): The object that owns the computed property.
+        """
+        if self._slotted:
+            if self._cacheable:
+                object.__setattr__(obj, self._cache_name, _NOT_CACHED)
+        else:
+            obj.__dict__.pop(self._cache_name, None)
 
     def getter(self, fget):
         """
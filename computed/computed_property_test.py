@@ -10,7 +10,7 @@ that provides cached property computation with dependency tracking. The decorato
 
 import unittest
 
-from computed import computed_property
+from computed import computed_property, computed_slots
 
 
 class Person:
@@ -25,6 +25,8 @@ class Person:
         _compute_count (int): Internal counter tracking property computations
     """
 
+    __slots__ = ('first', 'last', '_compute_count') + computed_slots('full_name')
+
     def __init__(self, first, last):
         """Initialize a Person instance with first and last names.
 
@@ -136,6 +138,188 @@ class TestComputedProperty(unittest.TestCase):
         self.assertEqual(p.first, "")
         self.assertEqual(p.last, "")
 
+    def test_dependency_map_is_read_only(self):
+        """Test the dependency map exposed on the class.
+
+        Verifies:
+        - Each dependency maps to the tuple of cache entries it invalidates
+        - The map cannot be modified through the class attribute
+        """
+        dependency_map = Person.__computed_dependency_map__
+        self.assertEqual(dependency_map["first"], ("_Person__cached_full_name",))
+        with self.assertRaises(TypeError):
+            dependency_map["first"] = ()
+
+    def test_slots_without_cache_slot(self):
+        """Test that a slotted class must reserve a slot for each cache.
+
+        Verifies:
+        - Accessing the property raises a descriptive AttributeError
+        - The getter is not called, so no uncached value is ever returned
+        - Subclasses adding a `__dict__` do not cache without invalidation
+        """
+        class Point:
+            __slots__ = ('x', 'calls')
+
+            def __init__(self):
+                self.x = 1
+                self.calls = 0
+
+            @computed_property('x')
+            def double(self):
+                self.calls += 1
+                return self.x * 2
+
+        class DictPoint(Point):
+            pass
+
+        for point in (Point(), DictPoint()):
+            with self.subTest(cls=type(point).__name__):
+                with self.assertRaisesRegex(AttributeError, "computed_slots"):
+                    _ = point.double
+                self.assertEqual(point.calls, 0)
+
+    def test_no_dependencies_keeps_plain_setattr(self):
+        """Test that dependency-free properties leave attribute writes alone.
+
+        Verifies:
+        - `__setattr__` is not overridden when nothing needs invalidating
+        - No dependency map is registered on the class
+        - The property is still computed once and cached
+        """
+        class Greeting:
+            def __init__(self):
+                self.calls = 0
+
+            @computed_property
+            def text(self):
+                self.calls += 1
+                return "hello"
+
+        g = Greeting()
+        self.assertIs(Greeting.__setattr__, object.__setattr__)
+        self.assertFalse(hasattr(Greeting, "__computed_dependency_map__"))
+        self.assertEqual(g.text, "hello")
+        self.assertEqual(g.text, "hello")
+        self.assertEqual(g.calls, 1)
+
+    def test_dict_backed_setter_and_deleter(self):
+        """Test setter and deleter on a class without `__slots__`.
+
+        Verifies:
+        - The cached value lives in the instance `__dict__`
+        - Setting and deleting the property drop the cached value
+        """
+        class Account:
+            def __init__(self, balance):
+                self.balance = balance
+
+            @computed_property('balance')
+            def label(self):
+                return f"balance: {self.balance}"
+
+            @label.setter
+            def label(self, value):
+                object.__setattr__(self, 'balance', int(value.split()[-1]))
+
+            @label.deleter
+            def label(self):
+                object.__setattr__(self, 'balance', 0)
+
+        account = Account(10)
+        self.assertEqual(account.label, "balance: 10")
+        self.assertIn("__cached_label", vars(account))
+
+        # The setter and deleter bypass the dependency tracking on purpose
+        account.label = "balance: 20"
+        self.assertEqual(account.label, "balance: 20")
+        del account.label
+        self.assertEqual(account.label, "balance: 0")
+
+    def test_dict_subclass_of_slotted_class(self):
+        """Test a class adding a `__dict__` below a slotted class.
+
+        Verifies:
+        - Inherited properties keep caching in their slot
+        - Properties of the subclass cache in the instance `__dict__`
+        - Changing a dependency invalidates both
+        - Instances of the slotted base class are unaffected
+        """
+        class Employee(Person):
+            @computed_property('last')
+            def initials(self):
+                return f"{self.first[0]}{self.last[0]}"
+
+        e = Employee("John", "Doe")
+        self.assertEqual((e.full_name, e.initials), ("John Doe", "JD"))
+        self.assertNotIn("_Person__cached_full_name", vars(e))
+        e.last = "Roe"
+        self.assertEqual((e.full_name, e.initials), ("John Roe", "JR"))
+        self.assertEqual(e._compute_count, 2)
+
+        p = Person("Jane", "Doe")
+        p.last = "Roe"
+        self.assertEqual(p.full_name, "Jane Roe")
+
+    def test_slotted_subclass_of_slotted_class(self):
+        """Test a slotted class adding computed properties below a slotted class.
+
+        Verifies:
+        - Instances of the base class are unaffected by the subclass' cache slots
+        - Changing a dependency invalidates the caches of both classes
+        """
+        class Base:
+            __slots__ = ('a',) + computed_slots('double')
+
+            def __init__(self):
+                self.a = 1
+
+            @computed_property('a')
+            def double(self):
+                return self.a * 2
+
+        class Sub(Base):
+            __slots__ = computed_slots('triple')
+
+            @computed_property('a')
+            def triple(self):
+                return self.a * 3
+
+        base = Base()
+        base.a = 2
+        self.assertEqual(base.double, 4)
+
+        sub = Sub()
+        self.assertEqual((sub.double, sub.triple), (2, 3))
+        sub.a = 5
+        self.assertEqual((sub.double, sub.triple), (10, 15))
+
+    def test_cached_none_value(self):
+        """Test that a computed value of None is cached like any other.
+
+        Verifies:
+        - A getter returning None is only evaluated once
+        """
+        class Lookup:
+            def __init__(self):
+                self.key = "missing"
+                self.calls = 0
+
+            @computed_property('key')
+            def value(self):
+                self.calls += 1
+                return None
+
+        lookup = Lookup()
+        self.assertIsNone(lookup.value)
+        self.assertIsNone(lookup.value)
+        self.assertEqual(lookup.calls, 1)
+
+        # Dict-backed instances are invalidated through their __dict__
+        lookup.key = "other"
+        self.assertIsNone(lookup.value)
+        self.assertEqual(lookup.calls, 2)
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -1,4 +1,4 @@
 """ Docstring for the __init__.py module.
 
 """
-from .last_lines import last_lines
+from .last_lines import last_lines, last_lines_raw
@@ -5,10 +5,13 @@ line by line. It's particularly useful for processing large files like logs wher
 the most recent entries appear at the end.
 
 The main functionality is provided by the `last_lines()` generator function which
-yields lines from the end of the file moving upwards.
+yields lines from the end of the file moving upwards. `last_lines_raw()` does the same
+over a memory-mapped file, yielding undecoded zero-copy views instead of strings.
 """
 
+import codecs
 import io
+import mmap
 import os
 
 from exceptions.buffer_too_small import BufferTooSmallException
@@ -28,67 +31,148 @@ def last_lines(filename, buf_size=io.DEFAULT_BUFFER_SIZE, encoding='utf-8'):
         str: Lines from the file in reverse order, with newline included.
 
     Raises:
+        LookupError: If the encoding is unknown.
         ValueError: If buf_size is too small for the encoding.
         FileNotFoundError: If the file doesn't exist.
         BufferTooSmallException: If buffer can't decode a multi-byte character.
         UnicodeDecodeError: For invalid encoding sequences within a buffer.
     """
+    # Resolve the codec once, before any IO: unknown encodings fail fast and every
+    # alias of UTF-8 ('UTF8', 'utf_8', 'u8', ...) is recognized by its canonical name
+    codec_name = codecs.lookup(encoding).name
+
     # Minimum buffer size depends on encoding (4 for UTF-8)
-    min_buf_size = 4 if encoding.lower().replace('-', '') in ('utf8', 'utf') else 1
+    min_buf_size = 4 if codec_name == 'utf-8' else 1
     if buf_size < min_buf_size:
         raise ValueError(f"buf_size must be at least {min_buf_size} for {encoding}")
 
     try:
-        with open(filename, 'rb') as fh:
-            file_size = fh.seek(0, os.SEEK_END)
+        # Raw descriptor + pread: one syscall per chunk, no seek or buffered-IO state
+        fd = os.open(filename, os.O_RDONLY)
+        try:
+            file_size = os.fstat(fd).st_size
             if file_size == 0:
                 return  # empty file
 
-            segment = None
-            offset = 0
+            # Every line is yielded with its newline, so the last line gets one too when the
+            # file lacks it. It is added to the decoded text, as the newline is not a single
+            # b'\n' byte in every encoding. The pending segment keeps its own newline.
             remaining_size = file_size
+            missing_newline = '' if os.pread(fd, 1, file_size - 1) == b'\n' else '\n'
+
+            # Pieces of the pending segment, last piece first. They are only joined once a
+            # newline completes the line, so a line spanning many chunks is copied once
+            # rather than once per chunk
+            pending = []
 
             while remaining_size > 0:
-                offset = min(file_size, offset + buf_size)
-                fh.seek(max(0, file_size - offset))
                 chunk_size = min(remaining_size, buf_size)
-                buffer = fh.read(chunk_size)
-
-                # Remove last newline only if it's the end of file
-                if remaining_size == file_size and buffer.endswith(b'\n'):
-                    buffer = buffer[:-1]
-
+                buffer = os.pread(fd, chunk_size, remaining_size - chunk_size)
                 remaining_size -= chunk_size
-                lines = buffer.split(b'\n')
 
-                if segment is not None:
-                    # Prepend pending segment to last line of current chunk
-                    lines[-1] += segment
+                first_newline = buffer.find(b'\n')
+                pending.append(buffer)
+                if first_newline < 0:
+                    # No line ends in this chunk: all of it is still pending
+                    continue
 
-                # The first line becomes the pending segment
-                segment = lines[0]
+                # Append pending segment to the last (partial) line of the current chunk
+                buffer = b''.join(reversed(pending))
 
-                # Yield all complete lines in reverse order
-                for line in reversed(lines[1:]):
+                # The first line becomes the pending segment. Everything after it is made
+                # of complete, newline-terminated lines, so it starts on a character
+                # boundary and can be decoded in one call instead of once per line
+                pending = [buffer[:first_newline + 1]]
+                try:
+                    text = buffer[first_newline + 1:].decode(encoding) + missing_newline
+                except UnicodeDecodeError:
+                    text = None
+
+                if text is not None:
+                    # Yield all complete lines in reverse order. Splitting the decoded text
+                    # in C beats scanning for each newline from Python on full reads, and
+                    # the list never holds more than one buffer's worth of lines
+                    lines = text.split('\n')
+                    lines.pop()  # empty string after the final newline
+                    missing_newline = ''
+                    for line in reversed(lines):
+                        yield line + '\n'
+                    continue
+
+                # Decode line by line so the lines after an undecodable one are still yielded
+                rfind = buffer.rfind
+                end = len(buffer)
+                while end > first_newline + 1:
+                    start = rfind(b'\n', 0, end - 1) + 1
                     try:
-                        yield line.decode(encoding) + '\n'
+                        line = buffer[start:end].decode(encoding) + missing_newline
                     except UnicodeDecodeError as e:
                         if remaining_size > 0:  # Still more data to read
                             raise BufferTooSmallException(
                                 f"Decoding failed. Try increasing buf_size (current: {buf_size})"
                             ) from e
                         raise  # Re-raise for actual decode errors
+                    missing_newline = ''
+                    yield line
+                    end = start
+
+            # Yield the remaining segment, i.e. the first line of the file
+            segment = b''.join(reversed(pending))
+            try:
+                line = segment.decode(encoding) + missing_newline
+            except UnicodeDecodeError as e:
+                raise BufferTooSmallException(
+                    f"Final segment decoding failed. Try increasing buf_size (current: {buf_size})"
+                ) from e
+            yield line
+        finally:
+            os.close(fd)
 
-            # Yield the remaining segment if any
-            if segment is not None:
-                try:
-                    yield segment.decode(encoding) + '\n'
-                except UnicodeDecodeError as e:
-                    raise BufferTooSmallException(
-                        f"Final segment decoding failed. Try increasing buf_size (current: {buf_size})"
-                    ) from e
+    except OSError as e:
+        if isinstance(e, FileNotFoundError):
+            raise
+        raise OSError(f"Error reading file {filename}") from e
+
+
+def last_lines_raw(filename):
+    """
+    A generator that yields lines from a file in reverse order as zero-copy byte views.
 
+    The file is memory-mapped and every line is yielded as a `memoryview` slice of the
+    mapping, so no `bytes` or `str` object is allocated per line. Callers that need text
+    decode on demand (`bytes(line).decode()`), while byte-level filtering pays no
+    decoding cost at all. The mapping stays alive for as long as any yielded view does.
+
+    Args:
+        filename (str): Path to the file to be read.
+
+    Yields:
+        memoryview: Lines from the file in reverse order, without the newline.
+
+    Raises:
+        FileNotFoundError: If the file doesn't exist.
+    """
+    try:
+        with open(filename, 'rb') as fh:
+            if os.fstat(fh.fileno()).st_size == 0:
+                return  # empty file, which cannot be mapped
+            mm = mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ)
     except OSError as e:
         if isinstance(e, FileNotFoundError):
             raise
         raise OSError(f"Error reading file {filename}") from e
+
+    view = memoryview(mm)
+    end = len(mm)
+
+    # Remove last newline only if it's the end of file
+    if mm[end - 1:end] == b'\n':
+        end -= 1
+
+    rfind = mm.rfind
+    newline = rfind(b'\n', 0, end)
+    while newline >= 0:
+        yield view[newline + 1:end]
+        end = newline
+        newline = rfind(b'\n', 0, end)
+    yield view[:end]
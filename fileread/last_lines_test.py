@@ -10,7 +10,7 @@ import unittest
 from itertools import islice
 
 from exceptions import BufferTooSmallException
-from fileread import last_lines
+from fileread import last_lines, last_lines_raw
 
 
 class TestLastLines(unittest.TestCase):
@@ -145,6 +145,19 @@ class TestLastLines(unittest.TestCase):
         self.assertEqual(len(lines), 1000)
         self.assertTrue(all(line.endswith('\n') for line in lines))
 
+    def test_many_lines_per_chunk(self):
+        """Test exact output when every buffer holds many short lines.
+
+        Verifies:
+        - Lines scanned backwards within a chunk come out in reverse file order
+        - Lines spanning chunk boundaries are stitched back together
+        """
+        expected = [f"{i}{'.' * (i % 7)}\n" for i in range(500)]
+        path = self._create_test_file("".join(expected))
+        for buf_size in (4, 13, 64, 4096):
+            with self.subTest(buf_size=buf_size):
+                self.assertEqual(list(last_lines(path, buf_size=buf_size)), expected[::-1])
+
     def test_unicode_edge_cases(self):
         """Test various Unicode handling cases.
 
@@ -165,6 +178,15 @@ class TestLastLines(unittest.TestCase):
                 path = self._create_test_file(content)
                 self.assertEqual(list(last_lines(path)), expected)
 
+    def test_missing_newline_in_other_encoding(self):
+        """Test the newline added to the last line of a non UTF-8 file.
+
+        Verifies that the missing newline is added to the decoded text rather than
+        to the raw bytes, where it would not form a valid UTF-16 character.
+        """
+        path = self._create_test_file("hello", encoding='utf-16')
+        self.assertEqual(list(last_lines(path, encoding='utf-16')), ["hello\n"])
+
     def test_huge_lines(self):
         """Test files with lines larger than buffer size.
 
@@ -188,6 +210,22 @@ class TestLastLines(unittest.TestCase):
         with self.assertRaises(BufferTooSmallException):
             list(last_lines(path))
 
+    def test_invalid_line_before_valid_ones(self):
+        """Test that lines after an undecodable line are still yielded.
+
+        Verifies that a decoding error is only raised once iteration
+        reaches the invalid line, even when it shares a buffer with valid lines.
+        """
+        path = os.path.join(self.test_dir.name, "mixed")
+        with open(path, 'wb') as f:
+            f.write(b'first\n\xff\xfe\nthird\nfourth\n')
+
+        lines = last_lines(path)
+        self.assertEqual(next(lines), "fourth\n")
+        self.assertEqual(next(lines), "third\n")
+        with self.assertRaises(UnicodeDecodeError):
+            next(lines)
+
     def test_partial_iteration(self):
         """Test partial file iteration capability.
 
@@ -213,6 +251,15 @@ class TestLastLines(unittest.TestCase):
         with self.assertRaises(ValueError):
             list(last_lines(path, buf_size=3))  # less than minimum 4
 
+    def test_unknown_encoding(self):
+        """Test that an unknown encoding is rejected before reading.
+
+        Verifies proper exception is raised for an encoding with no codec.
+        """
+        path = self._create_test_file("test")
+        with self.assertRaises(LookupError):
+            list(last_lines(path, encoding="no-such-codec"))
+
     def test_nonexistent_file(self):
         """Test handling of non-existent file paths.
 
@@ -221,6 +268,29 @@ class TestLastLines(unittest.TestCase):
         with self.assertRaises(FileNotFoundError):
             list(last_lines("/nonexistent/file/path"))
 
+    def test_raw_lines_match_decoded_lines(self):
+        """Test that zero-copy raw lines mirror the decoded ones.
+
+        Verifies:
+        - Raw lines are yielded as memoryviews in reverse order
+        - Decoding each view gives the `last_lines` output minus the newline
+        """
+        cases = ["L1\nL2\nL3\n", "L1\r\nL2", "\n", "😊 é\n\nend"]
+        for content in cases:
+            with self.subTest(content=content):
+                path = self._create_test_file(content)
+                raw = list(last_lines_raw(path))
+                self.assertTrue(all(isinstance(line, memoryview) for line in raw))
+                self.assertEqual(
+                    [bytes(line).decode('utf-8') + '\n' for line in raw],
+                    list(last_lines(path)),
+                )
+
+    def test_raw_empty_file(self):
+        """Test that an empty file yields no raw lines."""
+        path = self._create_test_file("")
+        self.assertEqual(list(last_lines_raw(path)), [])
+
 
 if __name__ == '__main__':
     unittest.main()
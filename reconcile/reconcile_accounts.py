@@ -10,11 +10,12 @@ Example:
     >>> print(result1[0])
     2023-01-01,Sales,100.00,Product A,FOUND
 """
-from typing import List, Tuple
+from typing import Iterable, List, Tuple
 from reconcile import TransactionReconciler
 
 
-def reconcile_accounts(transactions1: List[List[str]], transactions2: List[List[str]]) -> Tuple[List[str], List[str]]:
+def reconcile_accounts(transactions1: Iterable[List[str]],
+                       transactions2: Iterable[List[str]]) -> Tuple[List[str], List[str]]:
     """Reconcile two sets of transaction data and return matched results.
 
     This function provides a simplified interface for comparing transaction records
@@ -25,10 +26,11 @@ def reconcile_accounts(transactions1: List[List[str]], transactions2: List[List[
     - Returns the results in CSV-style format
 
     Args:
-        transactions1 (List[List[str]]): Raw transaction data from first source.
+        transactions1 (Iterable[List[str]]): Raw transaction data from first source.
                                         Each transaction should be a list of strings
-                                        in format [date, department, amount, name, ...]
-        transactions2 (List[List[str]]): Raw transaction data from second source.
+                                        in format [date, department, amount, name, ...].
+                                        Any iterable of rows works, e.g. a `csv.reader`.
+        transactions2 (Iterable[List[str]]): Raw transaction data from second source.
                                         Same format as transactions1.
 
     Returns:
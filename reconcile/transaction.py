@@ -5,36 +5,81 @@ financial transactions, including their date, department, amount, and other rele
 details. It also provides methods for comparing transactions.
 """
 
-from dataclasses import dataclass, field
-from datetime import datetime
-from typing import Optional, List
+from decimal import Decimal
+from typing import Optional, Union
 
 
-@dataclass
 class Transaction:
     """A class representing a financial transaction.
 
+    Uses `__slots__` rather than a per-instance `__dict__`: transactions are created in
+    bulk and their fields are read in the reconciliation hot loop, so slots halve their
+    memory footprint and turn attribute reads into fixed-offset lookups.
+
     Attributes:
-        date (datetime): The date and time when the transaction occurred.
+        date (int): The day the transaction occurred, as a `date.toordinal()` day number.
         department (str): The department associated with the transaction.
-        amount (float): The monetary amount of the transaction.
+        amount (Union[int, Decimal]): The monetary amount of the transaction, in cents.
+                                      A `Decimal` only for amounts finer than a cent or not finite.
         name (str): The name or description of the transaction.
         status (Optional[str]): The current status of the transaction (e.g., 'pending', 'completed').
                               Defaults to None if not specified.
-        original_row (List[str]): The original data row from which the transaction was created.
-                                Defaults to an empty list if not specified.
 
     Methods:
         matches(other): Determines if this transaction matches another based on key fields.
         is_date_close(other): Checks if this transaction's date is close to another.
     """
 
-    date: datetime.date
-    department: str
-    amount: float
-    name: str
-    status: Optional[str] = None
-    original_row: List[str] = field(default_factory=list)
+    __slots__ = ('date', 'department', 'amount', 'name', 'status')
+
+    def __init__(self, date: int, department: str, amount: Union[int, Decimal], name: str,
+                 status: Optional[str] = None):
+        """Initialize a Transaction.
+
+        Args:
+            date (int): The day the transaction occurred, as a `date.toordinal()` day number.
+            department (str): The department associated with the transaction.
+            amount (Union[int, Decimal]): The monetary amount of the transaction, in cents.
+            name (str): The name or description of the transaction.
+            status (Optional[str]): The current status of the transaction. Defaults to None.
+        """
+        self.date = date
+        self.department = department
+        self.amount = amount
+        self.name = name
+        self.status = status
+
+    def __repr__(self) -> str:
+        """Return a readable representation of the transaction.
+
+        Returns:
+            str: The class name followed by every field and its value.
+        """
+        return (
+            f"{type(self).__name__}(date={self.date!r}, department={self.department!r}, "
+            f"amount={self.amount!r}, name={self.name!r}, status={self.status!r})"
+        )
+
+    def __eq__(self, other: object) -> bool:
+        """Check if this transaction is equal to another object.
+
+        Compares all five fields (date, department, amount, name and status), status
+        included, like the dataclass-generated method it replaces. Use `matches` to
+        compare only the key fields.
+
+        Args:
+            other (object): The object to compare against.
+
+        Returns:
+            bool: True if other is a Transaction with the same field values, False if
+                any field differs. NotImplemented if other is not a Transaction.
+        """
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return (
+                (self.date, self.department, self.amount, self.name, self.status) ==
+                (other.date, other.department, other.amount, other.name, other.status)
+        )
 
     def matches(self, other: 'Transaction') -> bool:
         """Check if this transaction matches another transaction based on key fields.
@@ -63,4 +108,4 @@ class Transaction:
         Returns:
             bool: True if the dates are within one day of each other, False otherwise.
         """
-        return abs((self.date - other.date).days) <= 1
+        return abs(self.date - other.date) <= 1
@@ -4,11 +4,91 @@ The TransactionReconciler compares two sets of transactions, identifies matches
 and produces reconciliation reports showing which transactions were matched or missing from each set.
 """
 
-from datetime import datetime
-from typing import Tuple, List, Optional
+from bisect import bisect_left, bisect_right
+import csv
+from collections import defaultdict
+from datetime import date, datetime
+from decimal import Decimal, InvalidOperation
+from functools import lru_cache
+from operator import attrgetter
+import os
+import sys
+from typing import IO, Iterable, Tuple, List, Optional, Union
 
 from reconcile import Transaction
 
+# Largest date difference, in days, still accepted as a (close) match
+ONE_DAY = 1
+
+# Large read buffer so the C csv parser is fed in few, big reads
+CSV_READ_BUFFER_SIZE = 1 << 20
+
+
+@lru_cache(maxsize=4096)
+def _parse_date(value: str) -> int:
+    """Parse a YYYY-MM-DD date string into its proleptic Gregorian ordinal.
+
+    Uses the C-level `date.fromisoformat` instead of `strptime` for the zero-padded
+    YYYY-MM-DD form, and caches the results since the same dates repeat heavily
+    across a batch of transactions. Plain day numbers make date differences a
+    single int subtraction.
+
+    Args:
+        value (str): The date string to parse.
+
+    Returns:
+        int: The day number of the parsed date, as given by `date.toordinal`.
+
+    Raises:
+        ValueError: If the value does not match the YYYY-MM-DD format.
+    """
+    # From Python 3.11, fromisoformat also accepts other ISO 8601 forms (20230101,
+    # 2023-W01-1) that strptime rejects, so only hand it the exact padded layout
+    if len(value) == 10 and value[4] == value[7] == '-':
+        try:
+            return date.fromisoformat(value).toordinal()
+        except ValueError:
+            pass
+    # Everything else, including non zero-padded forms such as 2023-1-5
+    return datetime.strptime(value, "%Y-%m-%d").date().toordinal()
+
+
+def _parse_cents(value: str) -> Union[int, Decimal]:
+    """Parse a decimal amount string into cents.
+
+    Amounts are compared for equality, so they are kept as exact numbers rather
+    than floats: "100.1" and "100.10" both give 10010. The common form with at most
+    two decimals is handled with plain string slicing; anything else goes through
+    `Decimal`. Amounts finer than a cent, infinities and NaN stay exact `Decimal`
+    cents, which only compare equal to the same value ("12.345" and "12.3450").
+
+    Args:
+        value (str): The amount string to parse, e.g. "-5.50".
+
+    Returns:
+        Union[int, Decimal]: The amount in cents, as an int when it is a whole
+            number of cents.
+
+    Raises:
+        ValueError: If the value is not a number.
+    """
+    digits = value.strip()
+    sign = -1 if digits[:1] == '-' else 1
+    if digits[:1] in ('-', '+'):
+        digits = digits[1:]
+    whole, _, fraction = digits.partition('.')
+    if whole.isdigit() and len(fraction) <= 2 and (not fraction or fraction.isdigit()):
+        return sign * (int(whole) * 100 + int(fraction.ljust(2, '0')))
+
+    try:
+        cents = Decimal(value).scaleb(2)
+    except InvalidOperation:
+        # Also raised by signaling NaN, which float() rejects as well
+        raise ValueError(f"Invalid amount: {value!r}") from None
+    if cents.is_finite() and cents == cents.to_integral_value():
+        return int(cents)
+    return cents
+
 
 class TransactionReconciler:
     """A class for reconciling two sets of financial transactions.
@@ -21,25 +101,66 @@ class TransactionReconciler:
         transactions2 (List[Transaction]): Second set of transactions to reconcile.
 
     Methods:
+        from_csv: Creates a reconciler reading both sources from CSV files.
         parse_row: Converts a raw data row into a Transaction object.
-        find_match: Finds a matching transaction in a list of candidates.
+        find_match: Finds and claims a matching transaction among the unmatched candidates.
         reconcile: Performs the reconciliation between both transaction sets.
+        reconcile_stream: Performs the reconciliation and writes the results as CSV.
     """
 
-    def __init__(self, rows1: List[List[str]], rows2: List[List[str]]):
+    def __init__(self, rows1: Iterable[List[str]], rows2: Iterable[List[str]]):
         """Initialize the TransactionReconciler with two sets of transaction data.
 
         Args:
-            rows1 (List[List[str]]): Raw transaction data from the first source.
-            rows2 (List[List[str]]): Raw transaction data from the second source.
+            rows1 (Iterable[List[str]]): Raw transaction data from the first source.
+                Consumed once, so a streaming `csv.reader` can be passed directly.
+            rows2 (Iterable[List[str]]): Raw transaction data from the second source.
+        """
+        # The raw rows are kept for the output, parallel to the parsed transactions:
+        # the row of transactions1[i] is _rows1[i], so transactions hold no reference
+        self._rows1 = list(rows1)
+        self._rows2 = list(rows2)
+        self.transactions1 = [self.parse_row(row) for row in self._rows1]
+        self.transactions2 = [self.parse_row(row) for row in self._rows2]
+
+        # Index the candidates by the fields that must match exactly. Each bucket is
+        # sorted by date (stable, so ties keep their input order) and keeps its dates
+        # alongside, so the +/- 1 day window is found by bisection instead of a scan
+        buckets = defaultdict(list)
+        for txn in self.transactions2:
+            buckets[(txn.department, txn.amount, txn.name)].append(txn)
+        self._buckets = {}
+        for key, bucket in buckets.items():
+            bucket.sort(key=attrgetter('date'))
+            self._buckets[key] = (bucket, [txn.date for txn in bucket])
+
+    @classmethod
+    def from_csv(cls, path1: Union[str, os.PathLike],
+                 path2: Union[str, os.PathLike]) -> 'TransactionReconciler':
+        """Create a reconciler reading both transaction sets from CSV files.
+
+        Rows are streamed from the files through `csv.reader` straight into the
+        reconciler.
+
+        Args:
+            path1 (Union[str, os.PathLike]): Path to the CSV file of the first source.
+            path2 (Union[str, os.PathLike]): Path to the CSV file of the second source.
+
+        Returns:
+            TransactionReconciler: A reconciler holding the parsed transactions.
         """
-        self.transactions1 = [self.parse_row(row) for row in rows1]
-        self.transactions2 = [self.parse_row(row) for row in rows2]
+        with open(path1, newline='', buffering=CSV_READ_BUFFER_SIZE) as fh1, \
+                open(path2, newline='', buffering=CSV_READ_BUFFER_SIZE) as fh2:
+            return cls(csv.reader(fh1), csv.reader(fh2))
 
     @staticmethod
     def parse_row(row: List[str]) -> Transaction:
         """Convert a raw data row into a Transaction object.
 
+        Department and name are interned: they repeat across many rows of both sources,
+        so each distinct value is stored once and equal values compare by identity.
+        The amount is stored as integer cents.
+
         Args:
             row (List[str]): A list of strings representing a transaction in the format:
                           [date (YYYY-MM-DD), department, amount, name, ...]
@@ -48,59 +169,60 @@ class TransactionReconciler:
             Transaction: A Transaction object populated with the row's data.
         """
         return Transaction(
-            date=datetime.strptime(row[0], "%Y-%m-%d").date(),
-            department=row[1],
-            amount=float(row[2]),
-            name=row[3],
-            original_row=row
+            date=_parse_date(row[0]),
+            department=sys.intern(row[1]),
+            amount=_parse_cents(row[2]),
+            name=sys.intern(row[3])
         )
 
-    @staticmethod
-    def find_match(txn: Transaction, candidates: List[Transaction]) -> Optional[Transaction]:
-        """Find a matching transaction from a list of candidate transactions.
+    def find_match(self, txn: Transaction) -> Optional[Transaction]:
+        """Find a matching transaction among the unmatched candidates and claim it.
 
-        First looks for exact date matches, then falls back to near matches (±1 day).
-        Only considers candidates that haven't already been matched (status=None).
+        Prefers a candidate with the exact same date, then falls back to the earliest
+        near match (±1 day). The match is removed from the candidate index, so it
+        cannot be matched again.
 
         Args:
             txn (Transaction): The transaction to find a match for.
-            candidates (List[Transaction]): Potential matching transactions to search through.
 
         Returns:
             Optional[Transaction]: The best matching transaction if found, None otherwise.
         """
-        # Try exact date match first
-        exact_matches = [
-            c for c in candidates
-            if c.status is None and txn.date == c.date and txn.matches(c)
-        ]
-        if exact_matches:
-            return min(exact_matches, key=lambda c: c.date)  # pick earliest by date
-
-        # Try +/- 1 day match
-        close_matches = [
-            c for c in candidates
-            if c.status is None and txn.is_date_close(c) and txn.matches(c)
-        ]
-        if close_matches:
-            return min(close_matches, key=lambda c: c.date)
-
-        return None
+        key = (txn.department, txn.amount, txn.name)
+        bucket = self._buckets.get(key)
+        if bucket is None:
+            return None
+        candidates, dates = bucket
 
-    def reconcile(self) -> Tuple[List[str], List[str]]:
-        """Perform the reconciliation between both transaction sets.
+        # Candidates dated within the +/- 1 day window
+        lo = bisect_left(dates, txn.date - ONE_DAY)
+        hi = bisect_right(dates, txn.date + ONE_DAY, lo)
+        if lo == hi:
+            return None
 
-        Compares transactions from both sources, marks matches as "FOUND" and
-        unmatched transactions as "MISSING". Returns the results as CSV-style strings.
+        # Try exact date match first, then pick the earliest close match
+        index = bisect_left(dates, txn.date, lo, hi)
+        if index == hi or dates[index] != txn.date:
+            index = lo
 
-        Returns:
-            Tuple[List[str], List[str]]: A tuple containing:
-                - First list: Reconciled results from the first transaction set
-                - Second list: Reconciled results from the second transaction set
-                Each result includes the original data plus a status field.
+        dates.pop(index)
+        match = candidates.pop(index)
+        if not candidates:
+            # Drop exhausted buckets so later lookups for the key fail fast
+            del self._buckets[key]
+        return match
+
+    def _match_all(self) -> None:
+        """Match both transaction sets and set the status of every transaction.
+
+        Matches are marked as "FOUND" and unmatched transactions as "MISSING".
+        Transactions that already have a status are left untouched, so calling
+        this again is a no-op.
         """
         for txn1 in self.transactions1:
-            match = self.find_match(txn1, self.transactions2)
+            if txn1.status is not None:
+                continue  # already reconciled by a previous call
+            match = self.find_match(txn1)
             if match:
                 txn1.status = "FOUND"
                 match.status = "FOUND"
@@ -113,8 +235,43 @@ class TransactionReconciler:
             if txn.status is None:
                 txn.status = "MISSING"
 
-        # Convert to CSV-style strings with status
-        out1 = [",".join(txn.original_row + [txn.status]) for txn in self.transactions1]
-        out2 = [",".join(txn.original_row + [txn.status]) for txn in self.transactions2]
+    def reconcile(self) -> Tuple[List[str], List[str]]:
+        """Perform the reconciliation between both transaction sets.
+
+        Compares transactions from both sources, marks matches as "FOUND" and
+        unmatched transactions as "MISSING". Returns the results as CSV-style strings.
+
+        Returns:
+            Tuple[List[str], List[str]]: A tuple containing:
+                - First list: Reconciled results from the first transaction set
+                - Second list: Reconciled results from the second transaction set
+                Each result includes the original data plus a status field.
+        """
+        self._match_all()
+
+        # Convert to CSV-style strings with status, appended to the joined row rather
+        # than copying every row into a new list first
+        out1 = [f"{','.join(row)},{txn.status}" for row, txn in zip(self._rows1, self.transactions1)]
+        out2 = [f"{','.join(row)},{txn.status}" for row, txn in zip(self._rows2, self.transactions2)]
 
         return out1, out2
+
+    def reconcile_stream(self, out1_fp: IO[str], out2_fp: IO[str]) -> None:
+        """Perform the reconciliation and write the results straight to CSV files.
+
+        Same matching as `reconcile`, but each result row is written through a
+        `csv.writer` instead of being collected, so the results of a large batch
+        are never held in memory as strings. Unlike `reconcile`, fields are quoted
+        as needed by the `csv` module.
+
+        Args:
+            out1_fp (IO[str]): Writable text file receiving the first set's results.
+                Should be opened with `newline=''`.
+            out2_fp (IO[str]): Writable text file receiving the second set's results.
+        """
+        self._match_all()
+
+        csv.writer(out1_fp).writerows(
+            (*row, txn.status) for row, txn in zip(self._rows1, self.transactions1))
+        csv.writer(out2_fp).writerows(
+            (*row, txn.status) for row, txn in zip(self._rows2, self.transactions2))
@@ -10,6 +10,10 @@ This module contains test cases for the TransactionReconciler class, verifying:
 The tests use the standard unittest framework and follow AAA pattern (Arrange-Act-Assert).
 """
 
+import csv
+import io
+import os
+import tempfile
 import unittest
 
 from reconcile import TransactionReconciler
@@ -147,6 +151,154 @@ class TestTransactionReconciliation(unittest.TestCase):
         found_count = sum(1 for r in result2 if "FOUND" in r)
         self.assertEqual(1, found_count)
 
+    def test_exact_date_preferred_over_earlier_close_date(self):
+        """Test that an exact date match wins over an earlier near match.
+
+        Verifies that:
+        - A candidate on the same day is chosen even if one a day earlier exists
+        - Calling reconcile again does not change the results
+        """
+        data1 = [
+            ["2023-01-02", "Sales", "100.00", "Product A"]
+        ]
+        data2 = [
+            ["2023-01-01", "Sales", "100.00", "Product A"],  # Close date, earlier
+            ["2023-01-02", "Sales", "100.00", "Product A"]  # Exact date (should match this)
+        ]
+        reconciler = TransactionReconciler(data1, data2)
+        result1, result2 = reconciler.reconcile()
+
+        self.assertEqual(result2, [
+            "2023-01-01,Sales,100.00,Product A,MISSING",
+            "2023-01-02,Sales,100.00,Product A,FOUND",
+        ])
+        self.assertEqual(reconciler.reconcile(), (result1, result2))
+
+    def test_date_formats(self):
+        """Test which date layouts are accepted, regardless of the Python version.
+
+        Verifies that:
+        - Non zero-padded dates are parsed like their padded form
+        - Compact and ISO week dates are rejected
+        """
+        data1 = [["2023-1-5", "Sales", "100.00", "Product A"]]
+        data2 = [["2023-01-05", "Sales", "100.00", "Product A"]]
+        result1, _ = TransactionReconciler(data1, data2).reconcile()
+        self.assertEqual(result1, ["2023-1-5,Sales,100.00,Product A,FOUND"])
+
+        for value in ("20230105", "2023-W01-4"):
+            with self.subTest(value=value):
+                with self.assertRaises(ValueError):
+                    TransactionReconciler([[value, "Sales", "100.00", "Product A"]], [])
+
+    def test_amounts_compared_as_cents(self):
+        """Test that amounts written differently but worth the same match.
+
+        Verifies that:
+        - Trailing zeros in the amount do not prevent a match
+        - Negative amounts keep their sign
+        - Amounts finer than a cent are matched on their exact value
+        """
+        data1 = [
+            ["2023-01-01", "Sales", "100.1", "Product A"],
+            ["2023-01-01", "HR", "-5.5", "Refund"]
+        ]
+        data2 = [
+            ["2023-01-01", "Sales", "100.10", "Product A"],
+            ["2023-01-01", "HR", "5.50", "Refund"]
+        ]
+        result1, result2 = TransactionReconciler(data1, data2).reconcile()
+
+        self.assertEqual(result1, [
+            "2023-01-01,Sales,100.1,Product A,FOUND",
+            "2023-01-01,HR,-5.5,Refund,MISSING",
+        ])
+        self.assertEqual(result2, [
+            "2023-01-01,Sales,100.10,Product A,FOUND",
+            "2023-01-01,HR,5.50,Refund,MISSING",
+        ])
+
+        data1 = [
+            ["2023-01-01", "Sales", "12.345", "Product A"],
+            ["2023-01-01", "HR", "1e-3", "Fee"]
+        ]
+        data2 = [
+            ["2023-01-01", "Sales", "12.3450", "Product A"],
+            ["2023-01-01", "HR", "0.002", "Fee"]
+        ]
+        result1, result2 = TransactionReconciler(data1, data2).reconcile()
+
+        self.assertEqual(result1, [
+            "2023-01-01,Sales,12.345,Product A,FOUND",
+            "2023-01-01,HR,1e-3,Fee,MISSING",
+        ])
+        self.assertEqual(result2, [
+            "2023-01-01,Sales,12.3450,Product A,FOUND",
+            "2023-01-01,HR,0.002,Fee,MISSING",
+        ])
+
+    def test_streamed_rows(self):
+        """Test reconciliation directly from streaming CSV readers.
+
+        Verifies that:
+        - Rows can be consumed from a `csv.reader` without building lists first
+        - Results match those produced from materialized lists
+        """
+        csv1 = "2023-01-01,Sales,100.00,Product A\n2023-01-02,HR,200.00,Salary\n"
+        csv2 = "2023-01-02,Sales,100.00,Product A\n"
+        result1, result2 = TransactionReconciler(
+            csv.reader(io.StringIO(csv1)), csv.reader(io.StringIO(csv2))
+        ).reconcile()
+
+        self.assertEqual(result1, [
+            "2023-01-01,Sales,100.00,Product A,FOUND",
+            "2023-01-02,HR,200.00,Salary,MISSING",
+        ])
+        self.assertEqual(result2, ["2023-01-02,Sales,100.00,Product A,FOUND"])
+
+    def test_from_csv(self):
+        """Test building a reconciler directly from CSV files.
+
+        Verifies that:
+        - Both files are parsed, including quoted fields
+        - Results match those produced from the same rows in memory
+        """
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path1 = os.path.join(tmp_dir, "trans1.csv")
+            path2 = os.path.join(tmp_dir, "trans2.csv")
+            with open(path1, "w", newline='') as f:
+                f.write('2023-01-01,Sales,100.00,"Product A, B"\n2023-01-02,HR,200.00,Salary\n')
+            with open(path2, "w", newline='') as f:
+                f.write('2023-01-02,Sales,100.00,"Product A, B"\n')
+            result1, result2 = TransactionReconciler.from_csv(path1, path2).reconcile()
+
+        self.assertEqual(result1, [
+            "2023-01-01,Sales,100.00,Product A, B,FOUND",
+            "2023-01-02,HR,200.00,Salary,MISSING",
+        ])
+        self.assertEqual(result2, ["2023-01-02,Sales,100.00,Product A, B,FOUND"])
+
+    def test_reconcile_stream(self):
+        """Test writing the reconciliation results directly as CSV.
+
+        Verifies that:
+        - Each output file gets one CSV row per transaction, with its status
+        - Rows match the ones returned by `reconcile`
+        """
+        data1 = [
+            ["2023-01-01", "Sales", "100.00", "Product A"],
+            ["2023-01-02", "HR", "200.00", "Salary"]
+        ]
+        data2 = [
+            ["2023-01-02", "Sales", "100.00", "Product A"]
+        ]
+        out1, out2 = io.StringIO(newline=''), io.StringIO(newline='')
+        TransactionReconciler(data1, data2).reconcile_stream(out1, out2)
+
+        expected1, expected2 = TransactionReconciler(data1, data2).reconcile()
+        self.assertEqual(out1.getvalue().splitlines(), expected1)
+        self.assertEqual(out2.getvalue().splitlines(), expected2)
+
 
 if __name__ == '__main__':
     unittest.main()